@@ -29,6 +29,10 @@ try:
 except ImportError:
     AIOHOMEKIT_AVAILABLE = False
 
+# Discovery rounds in seconds. Reachable devices answer mDNS within
+# milliseconds, so short re-queries converge faster than one long scan.
+DISCOVERY_TIMEOUTS = (1, 2, 5)
+
 
 def generate_field_name(room: str, sensor_type: str) -> str:
     """Generate a valid field name from room and sensor type."""
@@ -40,9 +44,9 @@ def generate_field_name(room: str, sensor_type: str) -> str:
 
 
 def print_sensor_config(devices: list[dict]) -> None:
-    """Print Python code for SENSORS configuration."""
-    print("\n# Add these to your SENSORS list in homekit_logger.py:")
-    print("SENSORS = [")
+    """Print Python code for SENSOR_CONFIG configuration."""
+    print("\n# Add these to your SENSOR_CONFIG list in homekit_logger.py:")
+    print("SENSOR_CONFIG = [")
 
     for device in devices:
         room = device.get("room", "unknown")
@@ -73,6 +77,25 @@ def print_sensor_config(devices: list[dict]) -> None:
     print("]")
 
 
+def device_info_from_discovery(discovery) -> dict:
+    """Build device info for a discovered HomeKit device."""
+    device_info = {
+        "name": discovery.description.name,
+        "model": discovery.description.model,
+        "room": discovery.description.name,  # Default to device name
+        "has_temperature": False,
+        "has_humidity": False,
+        "has_co2": False,
+        "has_air_quality": False,
+    }
+
+    # Check characteristic types if we can pair
+    # Note: Full pairing requires setup code
+    print(f"Found: {discovery.description.name} ({discovery.description.model})")
+
+    return device_info
+
+
 async def discover_devices() -> list[dict]:
     """Discover HomeKit devices on the network."""
     if not AIOHOMEKIT_AVAILABLE:
@@ -82,29 +105,25 @@ async def discover_devices() -> list[dict]:
     controller = Controller()
     devices = []
 
-    print("Discovering HomeKit devices (this may take 30 seconds)...")
+    print(
+        "Discovering HomeKit devices "
+        f"(this may take up to {sum(DISCOVERY_TIMEOUTS)} seconds)..."
+    )
 
     try:
-        discoveries = await controller.discover_ip(timeout=30)
-
-        for discovery in discoveries:
-            device_info = {
-                "name": discovery.description.name,
-                "model": discovery.description.model,
-                "room": discovery.description.name,  # Default to device name
-                "has_temperature": False,
-                "has_humidity": False,
-                "has_co2": False,
-                "has_air_quality": False,
-            }
-
-            # Check characteristic types if we can pair
-            # Note: Full pairing requires setup code
-            print(
-                f"Found: {discovery.description.name} ({discovery.description.model})"
-            )
-
-            devices.append(device_info)
+        found = {}
+        for timeout in DISCOVERY_TIMEOUTS:
+            discoveries = await controller.discover_ip(timeout=timeout)
+            new = [d for d in discoveries if d.description.id not in found]
+            for discovery in new:
+                found[discovery.description.id] = discovery
+
+            # Stop once a re-query turns up nothing new
+            if found and not new:
+                break
+
+        for discovery in found.values():
+            devices.append(device_info_from_discovery(discovery))
 
     except Exception as e:
         print(f"Discovery error: {e}")
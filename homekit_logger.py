@@ -11,7 +11,7 @@ https://blog.claude.nl/posts/logging-homekit-data-to-google-sheets-for-free--wal
 
 Usage:
     1. Install dependencies: pip install flask flask-limiter
-    2. Edit the SENSORS list below to match your HomeKit sensors
+    2. Edit the SENSOR_CONFIG list below to match your HomeKit sensors
     3. Optionally set HOMEKIT_API_KEY environment variable for authentication
     4. Run: python homekit_logger.py
     5. Update your iOS Shortcut to POST to http://<your-mac-ip>:5000/log
@@ -22,15 +22,27 @@ For HTTPS (required by HomeKit hubs in some cases):
 """
 
 import argparse
+import atexit
+import csv
+import gzip
+import io
+import json
 import logging
+import math
 import os
+import queue
 import re
+import shutil
 import sqlite3
+import subprocess  # nosec B404 - only runs the sqlite3 shell with fixed arguments
+import threading
+import time
+import zlib
 from contextlib import contextmanager
 from datetime import datetime
-from typing import Any, Generator, Optional
+from typing import Any, Generator, Iterable, NamedTuple, Optional, Union
 
-from flask import Flask, Response, jsonify, render_template_string, request
+from flask import Flask, Response, jsonify, request
 
 # =============================================================================
 # CONFIGURATION - Edit these to match your HomeKit sensors
@@ -38,7 +50,7 @@ from flask import Flask, Response, jsonify, render_template_string, request
 
 # Define your sensors here. The 'field' is what you'll use in the iOS Shortcut
 # as the form field name (like Google's entry.XXXXX but simpler)
-SENSORS = [
+SENSOR_CONFIG = [
     # Outside
     {"field": "outside_temp", "name": "Outside Temperature", "unit": "°C"},
     {"field": "outside_humidity", "name": "Outside Humidity", "unit": "%"},
@@ -66,20 +78,73 @@ SENSORS = [
     {"field": "co2_level", "name": "CO2 Level", "unit": "ppm"},
 ]
 
+
+class Sensor(NamedTuple):
+    """A configured sensor: form field / column name, display name and unit."""
+
+    field: str
+    name: str
+    unit: str
+
+
+# Freeze the config into immutable records with attribute access
+SENSORS = tuple(Sensor(**sensor) for sensor in SENSOR_CONFIG)
+
 # Configuration from environment variables with defaults
 DATABASE_PATH = os.getenv("HOMEKIT_DB_PATH", "homekit_data.db")
 HOST = os.getenv("HOMEKIT_HOST", "0.0.0.0")  # nosec B104 - intentional for LAN access
 PORT = int(os.getenv("HOMEKIT_PORT", "5000"))
 API_KEY = os.getenv("HOMEKIT_API_KEY")  # Optional: set for authentication
+WORKERS = int(os.getenv("HOMEKIT_WORKERS", "2"))  # gunicorn worker processes
+THREADS = int(os.getenv("HOMEKIT_THREADS", "8"))  # gunicorn threads per worker
 
 # Limits
 MAX_READINGS_LIMIT = 10000
 MAX_REQUEST_SIZE = 1024 * 10  # 10KB max request body
+GZIP_MIN_SIZE = 500  # bytes; smaller responses are sent uncompressed
+GZIP_COMPRESS_LEVEL = 1  # favour speed, tabular text still shrinks several-fold
+DASHBOARD_READINGS = 50  # readings embedded in the dashboard page
+CSV_FETCH_SIZE = 5000  # rows per fetch and per streamed CSV chunk
+CSV_CHUNK_SIZE = 64 * 1024  # bytes per chunk read from the sqlite3 shell
+CSV_QUERY = "SELECT * FROM readings ORDER BY timestamp ASC"
+
+# Opt-in: let the sqlite3 shell format the CSV export natively. Its output
+# differs from the default export: text columns are quoted and REAL values
+# are printed with 15 significant digits instead of Python's repr.
+NATIVE_CSV = os.getenv("HOMEKIT_NATIVE_CSV", "").lower() in ("1", "true", "yes")
+SQLITE3_CLI = shutil.which("sqlite3") if NATIVE_CSV else None
+
+# Background writer: readings are queued by /log and committed in batches
+WRITE_QUEUE_SIZE = 10000
+WRITE_BATCH_SIZE = 500
+WRITE_BATCH_INTERVAL = 0.05  # seconds to wait for more rows before committing
+WRITE_RETRY_DELAY = 0.1  # first backoff after a busy/locked database (seconds)
+WRITE_RETRY_MAX_DELAY = 5.0  # backoff cap; the full queue answers /log with 503
+WRITE_RETRY_ATTEMPTS = 8  # retries before a batch is dropped (~16s of backoff)
+
+# Per-connection SQLite tuning (journal_mode=WAL is persistent and set in init_db)
+SQLITE_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",  # 256MB
+    "PRAGMA cache_size=-20000",  # ~20MB
+    "PRAGMA busy_timeout=5000",
+)
 
 # Regex pattern for valid sensor field names (compiled once at module level)
 VALID_FIELD_PATTERN = re.compile(r"^[a-z][a-z0-9_]*$")
 MEASUREMENT_PATTERN = re.compile(r"^([-+]?\d*\.?\d+)")
 
+# Known sensor field names, for O(1) filtering of posted keys
+_SENSOR_FIELDS = frozenset(s.field for s in SENSORS)
+
+# One canonical INSERT covering every sensor column; absent readings are NULL.
+# Fields come from the SENSORS config (validated at startup), so this is safe.
+INSERT_SQL = "INSERT INTO readings ({}) VALUES ({})".format(  # nosec B608
+    ", ".join(f'"{s.field}"' for s in SENSORS),
+    ", ".join("?" for _ in SENSORS),
+)
+
 # =============================================================================
 # Logging Setup
 # =============================================================================
@@ -125,12 +190,23 @@ except ImportError:
 
     limiter = NoOpLimiter()
 
+# Fast JSON encoding (optional - only if orjson is installed)
+try:
+    import orjson
+
+    ORJSON_ENABLED = True
+except ImportError:
+    ORJSON_ENABLED = False
+    logger.info(
+        "orjson not installed, using stdlib json. Install with: pip install orjson"
+    )
+
 
 def validate_sensors_config() -> None:
     """Validate that all sensor field names are safe SQL identifiers."""
     seen_fields = set()
     for sensor in SENSORS:
-        field = sensor.get("field", "")
+        field = sensor.field
         if not VALID_FIELD_PATTERN.match(field):
             raise ValueError(
                 f"Invalid sensor field name: '{field}'. "
@@ -142,69 +218,104 @@ def validate_sensors_config() -> None:
     logger.info("Sensor configuration validated", extra={"sensors": list(seen_fields)})
 
 
+def connect_db(**kwargs: Any) -> sqlite3.Connection:
+    """Open a database connection with the tuning PRAGMAs applied."""
+    conn = sqlite3.connect(DATABASE_PATH, **kwargs)
+    for pragma in SQLITE_PRAGMAS:
+        conn.execute(pragma)
+    return conn
+
+
+# Each request thread keeps one open connection (and its warm page cache)
+_tls = threading.local()
+_connections: list[tuple[threading.Thread, sqlite3.Connection]] = []
+_connections_lock = threading.Lock()
+
+
+def _open_conn() -> sqlite3.Connection:
+    """Open and cache a connection for the current thread."""
+    conn = connect_db(check_same_thread=False)
+    conn.row_factory = sqlite3.Row
+
+    with _connections_lock:
+        # Close connections left behind by threads that have since exited
+        for thread, stale in _connections:
+            if not thread.is_alive():
+                stale.close()
+        _connections[:] = [c for c in _connections if c[0].is_alive()]
+        _connections.append((threading.current_thread(), conn))
+
+    _tls.conn = conn
+    return conn
+
+
+@atexit.register
+def _close_connections() -> None:
+    """Close all cached connections at interpreter exit."""
+    with _connections_lock:
+        for _, conn in _connections:
+            conn.close()
+        _connections.clear()
+
+
 @contextmanager
 def get_db() -> Generator[sqlite3.Connection, None, None]:
-    """Get database connection with row factory for dict-like access."""
-    conn = sqlite3.connect(DATABASE_PATH)
-    conn.row_factory = sqlite3.Row
+    """Get this thread's database connection with row factory for dict-like access."""
+    conn = getattr(_tls, "conn", None) or _open_conn()
     try:
         yield conn
-    finally:
-        conn.close()
+    except BaseException:
+        conn.rollback()
+        raise
 
 
 def init_db() -> None:
     """Initialize the database with the readings table and migrate schema if needed."""
     try:
         with get_db() as conn:
-            cursor = conn.cursor()
-
-            # Check if table exists
-            cursor.execute(
-                "SELECT name FROM sqlite_master WHERE type='table' AND name='readings'"
-            )
-            table_exists = cursor.fetchone() is not None
-
-            if not table_exists:
-                # Create new table with all sensor columns
-                columns = ", ".join([f'"{s["field"]}" REAL' for s in SENSORS])
-                cursor.execute(
-                    f"""
-                    CREATE TABLE readings (
-                        id INTEGER PRIMARY KEY AUTOINCREMENT,
-                        timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
-                        {columns}
-                    )
-                """
-                )
-                logger.info("Created new readings table")
-            else:
-                # Migrate: add any missing columns for new sensors
-                cursor.execute("PRAGMA table_info(readings)")
-                existing_columns = {row[1] for row in cursor.fetchall()}
-
-                for sensor in SENSORS:
-                    field = sensor["field"]
-                    if field not in existing_columns:
-                        cursor.execute(
-                            f'ALTER TABLE readings ADD COLUMN "{field}" REAL'
-                        )
-                        logger.info(f"Added new column: {field}")
-
-            # Create an index on timestamp for faster queries
-            cursor.execute(
-                """
-                CREATE INDEX IF NOT EXISTS idx_timestamp ON readings(timestamp)
+            # WAL lets readers proceed while the writer commits
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA wal_autocheckpoint=1000")
+
+            # Create the table with all sensor columns, plus an index on
+            # timestamp for faster queries, as one script in one transaction
+            columns = ", ".join([f'"{s.field}" REAL' for s in SENSORS])
+            conn.executescript(
+                f"""
+                BEGIN;
+                CREATE TABLE IF NOT EXISTS readings (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
+                    {columns}
+                );
+                CREATE INDEX IF NOT EXISTS idx_timestamp ON readings(timestamp);
+                COMMIT;
             """
             )
 
-            conn.commit()
+            # Migrate: add any missing columns for new sensors
+            existing_columns = {
+                row[0]
+                for row in conn.execute(
+                    "SELECT name FROM pragma_table_info('readings')"
+                )
+            }
+            missing = [s.field for s in SENSORS if s.field not in existing_columns]
+
+            if missing:
+                # All ALTERs in one script and one transaction
+                alters = "".join(
+                    f'ALTER TABLE readings ADD COLUMN "{field}" REAL;'
+                    for field in missing
+                )
+                conn.executescript(f"BEGIN;{alters}COMMIT;")
+                logger.info(f"Added new columns: {', '.join(missing)}")
 
         logger.info(
             "Database initialized",
             extra={
                 "database_path": DATABASE_PATH,
-                "sensors": [s["field"] for s in SENSORS],
+                "sensors": [s.field for s in SENSORS],
             },
         )
     except sqlite3.Error as e:
@@ -212,6 +323,120 @@ def init_db() -> None:
         raise
 
 
+# =============================================================================
+# Background Writer
+# =============================================================================
+
+_write_queue: "queue.Queue[Optional[tuple]]" = queue.Queue(maxsize=WRITE_QUEUE_SIZE)
+_writer_thread: Optional[threading.Thread] = None
+_writer_lock = threading.Lock()
+_writer_stopping = threading.Event()
+
+
+def _is_transient(error: sqlite3.Error) -> bool:
+    """Check whether a write failed only because another connection held a lock."""
+    # sqlite_errorcode is the extended code; the low byte is the primary code
+    code = getattr(error, "sqlite_errorcode", None)
+    if code is not None:
+        return code & 0xFF in (sqlite3.SQLITE_BUSY, sqlite3.SQLITE_LOCKED)
+    message = str(error).lower()
+    return "locked" in message or "busy" in message
+
+
+def _write_batch(conn: sqlite3.Connection, rows: list[tuple]) -> None:
+    """Insert a batch of INSERT_SQL value tuples in a single transaction."""
+    cursor = conn.cursor()
+    cursor.execute("BEGIN")
+    try:
+        cursor.executemany(INSERT_SQL, rows)
+        cursor.execute("COMMIT")
+    except sqlite3.Error:
+        cursor.execute("ROLLBACK")
+        raise
+
+
+def _writer_loop() -> None:
+    """Drain the write queue, committing up to WRITE_BATCH_SIZE rows at a time."""
+    conn = connect_db(isolation_level=None)
+    conn.execute("PRAGMA wal_autocheckpoint=1000")
+
+    running = True
+    while running:
+        rows = [_write_queue.get()]
+        deadline = time.monotonic() + WRITE_BATCH_INTERVAL
+        while len(rows) < WRITE_BATCH_SIZE:
+            timeout = deadline - time.monotonic()
+            try:
+                rows.append(
+                    _write_queue.get(timeout=timeout)
+                    if timeout > 0
+                    else _write_queue.get_nowait()
+                )
+            except queue.Empty:
+                break
+
+        # None is the shutdown sentinel queued by _stop_writer
+        if None in rows:
+            running = False
+            rows = [row for row in rows if row is not None]
+        if not rows:
+            continue
+
+        delay = WRITE_RETRY_DELAY
+        for attempt in range(WRITE_RETRY_ATTEMPTS + 1):
+            try:
+                _write_batch(conn, rows)
+                logger.info(
+                    f"Logged {len(rows)} reading(s)", extra={"count": len(rows)}
+                )
+                break
+            except sqlite3.Error as e:
+                # Busy/locked (e.g. another worker's writer) is worth retrying;
+                # anything else, like a missing table, will not fix itself
+                if (
+                    not _is_transient(e)
+                    or attempt == WRITE_RETRY_ATTEMPTS
+                    or _writer_stopping.is_set()
+                ):
+                    logger.error(
+                        f"Database error in writer, dropped {len(rows)} reading(s): {e}"
+                    )
+                    break
+                logger.warning(
+                    f"Database busy in writer, retrying {len(rows)} reading(s) "
+                    f"in {delay:.1f}s: {e}"
+                )
+                # Returns early when shutdown is requested
+                _writer_stopping.wait(delay)
+                delay = min(delay * 2, WRITE_RETRY_MAX_DELAY)
+
+    conn.close()
+
+
+def _start_writer() -> None:
+    """Start the background writer thread if it is not already running."""
+    global _writer_thread
+    with _writer_lock:
+        if _writer_thread is None or not _writer_thread.is_alive():
+            _writer_thread = threading.Thread(
+                target=_writer_loop, name="homekit-writer", daemon=True
+            )
+            _writer_thread.start()
+
+
+@atexit.register
+def _stop_writer() -> None:
+    """Flush queued readings to the database before the interpreter exits."""
+    if _writer_thread is not None and _writer_thread.is_alive():
+        _writer_stopping.set()
+        try:
+            _write_queue.put(None, timeout=1)
+        except queue.Full:
+            # The writer is behind; it keeps draining until the join times out
+            pass
+        _writer_thread.join(timeout=5)
+
+
 def parse_measurement(value: Any) -> Optional[float]:
     """
     Parse a measurement value, stripping units if present.
@@ -227,10 +452,27 @@ def parse_measurement(value: Any) -> Optional[float]:
         18.4
         >>> parse_measurement("65 %")
         65.0
+        >>> parse_measurement(21.5)
+        21.5
     """
-    if value is None:
+    if value is None or isinstance(value, bool):
         return None
 
+    # Fast path: plain numbers (JSON numbers or bare numeric strings)
+    if isinstance(value, (int, float)):
+        try:
+            number = float(value)
+        except OverflowError:
+            # Integers too large for a float (stdlib json parses any length)
+            return None
+        return number if math.isfinite(number) else None
+    try:
+        number = float(value)
+        if math.isfinite(number):
+            return number
+    except (TypeError, ValueError, OverflowError):
+        pass
+
     # Convert to string and strip whitespace
     value_str = str(value).strip()
 
@@ -248,13 +490,92 @@ def parse_measurement(value: Any) -> Optional[float]:
     return None
 
 
-def check_api_key() -> Optional[tuple]:
-    """Check API key if authentication is enabled. Returns error response or None."""
+def dumps_json(payload: Any) -> bytes:
+    """Serialize payload to JSON bytes, using orjson when available."""
+    if ORJSON_ENABLED:
+        return orjson.dumps(payload)
+    return json.dumps(payload, separators=(",", ":")).encode("utf-8")
+
+
+def loads_json(data: bytes) -> Any:
+    """Parse JSON bytes, using orjson when available. Raises ValueError."""
+    if ORJSON_ENABLED:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_response(payload: Any) -> Response:
+    """Serialize payload to a JSON response."""
+    return Response(dumps_json(payload), mimetype="application/json")
+
+
+def accepts_gzip() -> bool:
+    """Check whether the client accepts gzip-encoded responses."""
+    # Quality must be checked: "gzip;q=0" is listed but means "never gzip"
+    return request.accept_encodings["gzip"] > 0
+
+
+def gzip_stream(
+    chunks: Iterable[Union[str, bytes]],
+) -> Generator[bytes, None, None]:
+    """Gzip a stream of chunks, flushing after each so output is not held back."""
+    compressor = zlib.compressobj(GZIP_COMPRESS_LEVEL, zlib.DEFLATED, 31)
+    for chunk in chunks:
+        if isinstance(chunk, str):
+            chunk = chunk.encode("utf-8")
+        yield compressor.compress(chunk) + compressor.flush(zlib.Z_SYNC_FLUSH)
+    yield compressor.flush()
+
+
+@app.after_request
+def compress_response(response: Response) -> Response:
+    """Gzip buffered JSON responses when the client accepts it."""
+    if (
+        response.mimetype != "application/json"
+        or response.status_code != 200
+        or response.direct_passthrough
+        or response.is_streamed
+        or "Content-Encoding" in response.headers
+    ):
+        return response
+
+    response.vary.add("Accept-Encoding")
+    if not accepts_gzip():
+        return response
+
+    data = response.get_data()
+    if len(data) < GZIP_MIN_SIZE:
+        return response
+
+    response.set_data(gzip.compress(data, compresslevel=GZIP_COMPRESS_LEVEL))
+    response.headers["Content-Encoding"] = "gzip"
+    return response
+
+
+_last_timestamp: tuple[int, str] = (0, "")
+
+
+def now_iso() -> str:
+    """Current local time in ISO format, formatted at most once per second."""
+    global _last_timestamp
+    now = int(time.time())
+    if now != _last_timestamp[0]:
+        _last_timestamp = (now, datetime.fromtimestamp(now).isoformat())
+    return _last_timestamp[1]
+
+
+def is_authorized() -> bool:
+    """Check whether the request carries the API key (always true without one)."""
     if API_KEY is None:
-        return None
+        return True
 
     provided_key = request.headers.get("X-API-Key") or request.args.get("api_key")
-    if provided_key != API_KEY:
+    return provided_key == API_KEY
+
+
+def check_api_key() -> Optional[tuple]:
+    """Check API key if authentication is enabled. Returns error response or None."""
+    if not is_authorized():
         logger.warning(
             "Unauthorized access attempt", extra={"remote_addr": request.remote_addr}
         )
@@ -269,8 +590,11 @@ def log_reading():
     Endpoint to receive HomeKit sensor data.
     Accepts form data or JSON with sensor field names as keys.
 
+    Readings are queued for the background writer, which commits them in
+    batches, so the response does not carry the database row id.
+
     Returns:
-        JSON response with status, id, and data on success
+        202 JSON response with status and data once the reading is queued
         JSON error response on failure
     """
     # Check authentication
@@ -281,19 +605,30 @@ def log_reading():
     try:
         # Get data from form or JSON
         if request.is_json:
-            data = request.json or {}
+            # Parse the raw body directly; cache=False avoids keeping a copy
+            body = request.get_data(cache=False)
+            try:
+                data = (loads_json(body) if body else None) or {}
+            except ValueError:
+                return jsonify({"status": "error", "message": "Invalid JSON"}), 400
         else:
             data = request.form.to_dict()
 
         if not data:
             return jsonify({"status": "error", "message": "No data received"}), 400
 
+        if not isinstance(data, dict):
+            return (
+                jsonify({"status": "error", "message": "Expected a JSON object"}),
+                400,
+            )
+
         # Parse and validate the data - only accept known sensor fields
-        parsed_data = {}
-        for sensor in SENSORS:
-            field = sensor["field"]
-            if field in data:
-                parsed_data[field] = parse_measurement(data[field])
+        parsed_data = {
+            field: parse_measurement(value)
+            for field, value in data.items()
+            if field in _SENSOR_FIELDS
+        }
 
         if not parsed_data:
             return (
@@ -301,35 +636,37 @@ def log_reading():
                 400,
             )
 
-        # Insert into database
-        with get_db() as conn:
-            cursor = conn.cursor()
-
-            # Fields come from validated SENSORS config, so this is safe
-            columns = ", ".join([f'"{k}"' for k in parsed_data.keys()])
-            placeholders = ", ".join(["?" for _ in parsed_data])
-            values = list(parsed_data.values())
-
-            query = f"INSERT INTO readings ({columns}) VALUES ({placeholders})"  # nosec B608
-            cursor.execute(query, values)
-            conn.commit()
-            reading_id = cursor.lastrowid
+        # Hand off to the background writer in INSERT_SQL column order
+        values = tuple(parsed_data.get(s.field) for s in SENSORS)
+        _start_writer()
+        try:
+            _write_queue.put_nowait(values)
+        except queue.Full:
+            logger.error("Write queue full, rejecting reading")
+            return jsonify({"status": "error", "message": "Server busy"}), 503
 
-        logger.info(
-            f"Logged reading #{reading_id}",
-            extra={"reading_id": reading_id, "data": parsed_data},
-        )
+        logger.debug("Queued reading", extra={"data": parsed_data})
 
-        return jsonify({"status": "success", "id": reading_id, "data": parsed_data})
+        return jsonify({"status": "queued", "data": parsed_data}), 202
 
-    except sqlite3.Error as e:
-        logger.error(f"Database error in log_reading: {e}")
-        return jsonify({"status": "error", "message": "Database error"}), 500
     except Exception as e:
         logger.exception(f"Unexpected error in log_reading: {e}")
         return jsonify({"status": "error", "message": "Internal server error"}), 500
 
 
+def fetch_recent_readings(limit: int) -> list[dict]:
+    """Fetch the newest readings first, as dicts keyed by column name."""
+    with get_db() as conn:
+        cursor = conn.cursor()
+        # Readings are append-only, so id order matches timestamp order and
+        # walking the primary key backwards avoids a sort or index lookup
+        cursor.execute("SELECT * FROM readings ORDER BY id DESC LIMIT ?", (limit,))
+        rows = cursor.fetchall()
+        columns = [desc[0] for desc in cursor.description]
+
+    return [dict(zip(columns, row)) for row in rows]
+
+
 @app.route("/readings", methods=["GET"])
 @limiter.limit("100 per minute")
 def get_readings():
@@ -342,15 +679,7 @@ def get_readings():
         limit = min(request.args.get("limit", 100, type=int), MAX_READINGS_LIMIT)
         limit = max(1, limit)  # Ensure at least 1
 
-        with get_db() as conn:
-            cursor = conn.cursor()
-            cursor.execute(
-                "SELECT * FROM readings ORDER BY timestamp DESC LIMIT ?", (limit,)
-            )
-            rows = cursor.fetchall()
-
-        readings = [dict(row) for row in rows]
-        return jsonify(readings)
+        return json_response(fetch_recent_readings(limit))
 
     except sqlite3.Error as e:
         logger.error(f"Database error in get_readings: {e}")
@@ -366,34 +695,90 @@ def export_csv():
         return auth_error
 
     def generate_csv() -> Generator[str, None, None]:
-        """Stream CSV data row by row."""
+        """Stream CSV data in chunks of CSV_FETCH_SIZE rows."""
         try:
             with get_db() as conn:
                 cursor = conn.cursor()
-                cursor.execute("SELECT * FROM readings ORDER BY timestamp ASC")
+                cursor.arraysize = CSV_FETCH_SIZE
+                cursor.execute(CSV_QUERY)
+
+                buffer = io.StringIO()
+                writer = csv.writer(buffer, lineterminator="\n")
 
                 # Get column names from cursor description
-                headers = [desc[0] for desc in cursor.description]
-                yield ",".join(headers) + "\n"
+                writer.writerow([desc[0] for desc in cursor.description])
 
-                # Stream rows in batches
+                # Stream rows in batches, one chunk per fetch
                 while True:
-                    rows = cursor.fetchmany(1000)
+                    rows = cursor.fetchmany()
                     if not rows:
                         break
-                    for row in rows:
-                        yield ",".join(
-                            str(val) if val is not None else "" for val in row
-                        ) + "\n"
+                    writer.writerows(rows)
+                    yield buffer.getvalue()
+                    buffer.seek(0)
+                    buffer.truncate()
+
+                # Header-only output for an empty table
+                if buffer.tell():
+                    yield buffer.getvalue()
         except sqlite3.Error as e:
             logger.error(f"Database error in export_csv: {e}")
             yield f"Error: {e}\n"
 
-    return Response(
-        generate_csv(),
-        mimetype="text/csv",
-        headers={"Content-Disposition": "attachment; filename=homekit_readings.csv"},
+    def generate_csv_native() -> Generator[bytes, None, None]:
+        """Stream CSV produced by the sqlite3 shell in CSV_CHUNK_SIZE chunks."""
+        # Write the header ourselves: the shell omits it when there are no rows
+        try:
+            with get_db() as conn:
+                columns = [
+                    row[0]
+                    for row in conn.execute(
+                        "SELECT name FROM pragma_table_info('readings')"
+                    )
+                ]
+        except sqlite3.Error as e:
+            logger.error(f"Database error in export_csv: {e}")
+            yield f"Error: {e}\n".encode("utf-8")
+            return
+
+        buffer = io.StringIO()
+        csv.writer(buffer, lineterminator="\n").writerow(columns)
+        yield buffer.getvalue().encode("utf-8")
+
+        process = subprocess.Popen(  # nosec B603 - fixed argument list, no shell
+            [SQLITE3_CLI, "-batch", "-csv", "-newline", "\n"]
+            + [DATABASE_PATH, CSV_QUERY],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+        try:
+            while chunk := process.stdout.read(CSV_CHUNK_SIZE):
+                yield chunk
+            if process.wait() != 0:
+                error = process.stderr.read().decode("utf-8", "replace").strip()
+                logger.error(f"sqlite3 error in export_csv: {error}")
+                yield f"Error: {error}\n".encode("utf-8")
+        finally:
+            # Stop the shell if the client disconnected mid-export
+            if process.poll() is None:
+                process.kill()
+                process.wait()
+            process.stdout.close()
+            process.stderr.close()
+
+    headers = {
+        "Content-Disposition": "attachment; filename=homekit_readings.csv",
+        "Vary": "Accept-Encoding",
+    }
+    body: Iterable[Union[str, bytes]] = (
+        generate_csv_native() if SQLITE3_CLI else generate_csv()
     )
+    if accepts_gzip():
+        body = gzip_stream(body)
+        headers["Content-Encoding"] = "gzip"
+
+    return Response(body, mimetype="text/csv", headers=headers)
 
 
 # Simple HTML dashboard
@@ -429,7 +814,7 @@ DASHBOARD_HTML = """
 
     <div class="card">
         <h2>Current Readings</h2>
-        <button class="refresh-btn" onclick="location.reload()">Refresh</button>
+        <button class="refresh-btn" onclick="refresh()">Refresh</button>
         <p style="color: #666; font-size: 0.9em;">Click any sensor to view its history</p>
         <div class="sensor-grid" id="current-readings">
             Loading...
@@ -452,41 +837,58 @@ DASHBOARD_HTML = """
         </table>
     </div>
 
+    <!-- INITIAL_READINGS -->
     <script>
-        fetch('/readings?limit=50')
-            .then(r => r.json())
-            .then(data => {
-                // Update current readings
-                if (data.length > 0) {
-                    const latest = data[0];
-                    const sensors = Object.keys(latest).filter(k => k !== 'id' && k !== 'timestamp');
-                    document.getElementById('current-readings').innerHTML = sensors.map(s => {
-                        const val = latest[s];
-                        return `<a href="/device/${s}" class="sensor-card">
-                            <div class="sensor-name">${s.replace(/_/g, ' ')}</div>
-                            <div class="sensor-value">${val !== null ? val : '—'}</div>
-                            <div class="sensor-hint">Click for history</div>
-                        </a>`;
-                    }).join('');
-                }
+        function render(data) {
+            // Update current readings
+            if (data.length > 0) {
+                const latest = data[0];
+                const sensors = Object.keys(latest).filter(k => k !== 'id' && k !== 'timestamp');
+                document.getElementById('current-readings').innerHTML = sensors.map(s => {
+                    const val = latest[s];
+                    return `<a href="/device/${s}" class="sensor-card">
+                        <div class="sensor-name">${s.replace(/_/g, ' ')}</div>
+                        <div class="sensor-value">${val !== null ? val : '—'}</div>
+                        <div class="sensor-hint">Click for history</div>
+                    </a>`;
+                }).join('');
+            }
 
-                // Update table
-                const table = document.getElementById('readings-table');
-                if (data.length > 0) {
-                    const headers = Object.keys(data[0]);
-                    table.innerHTML = `
-                        <thead><tr>${headers.map(h => `<th>${h}</th>`).join('')}</tr></thead>
-                        <tbody>${data.map(row =>
-                            `<tr>${headers.map(h => `<td>${row[h] !== null ? row[h] : ''}</td>`).join('')}</tr>`
-                        ).join('')}</tbody>
-                    `;
-                }
-            });
+            // Update table
+            const table = document.getElementById('readings-table');
+            if (data.length > 0) {
+                const headers = Object.keys(data[0]);
+                table.innerHTML = `
+                    <thead><tr>${headers.map(h => `<th>${h}</th>`).join('')}</tr></thead>
+                    <tbody>${data.map(row =>
+                        `<tr>${headers.map(h => `<td>${row[h] !== null ? row[h] : ''}</td>`).join('')}</tr>`
+                    ).join('')}</tbody>
+                `;
+            }
+        }
+
+        function refresh() {
+            fetch('/readings?limit=50')
+                .then(r => r.json())
+                .then(render);
+        }
+
+        // First paint uses readings embedded by the server when available
+        if (window.__INITIAL__) {
+            render(window.__INITIAL__);
+        } else {
+            refresh();
+        }
     </script>
 </body>
 </html>
 """
 
+# Encoded once; the initial readings script is spliced in at the placeholder
+_DASHBOARD_HEAD, _DASHBOARD_TAIL = (
+    part.encode("utf-8") for part in DASHBOARD_HTML.split("<!-- INITIAL_READINGS -->")
+)
+
 # Device history page
 DEVICE_HTML = """
 <!DOCTYPE html>
@@ -659,22 +1061,39 @@ DEVICE_HTML = """
 
 @app.route("/")
 def dashboard():
-    """Simple web dashboard to view the data."""
-    return render_template_string(DASHBOARD_HTML)
+    """Simple web dashboard to view the data, with the latest readings embedded."""
+    initial = b""
+    # Without the API key the page falls back to fetching /readings itself
+    if is_authorized():
+        try:
+            readings = dumps_json(fetch_recent_readings(DASHBOARD_READINGS))
+            # Keep "</script>" in the data from closing the tag early
+            readings = readings.replace(b"</", b"<\\/")
+            initial = b"<script>window.__INITIAL__ = " + readings + b";</script>"
+        except sqlite3.Error as e:
+            logger.error(f"Database error in dashboard: {e}")
+
+    response = Response(
+        _DASHBOARD_HEAD + initial + _DASHBOARD_TAIL, mimetype="text/html"
+    )
+    # The page carries data, so browsers revalidate; unchanged pages get a 304
+    response.cache_control.no_cache = True
+    response.add_etag()
+    return response.make_conditional(request)
 
 
 @app.route("/device/<sensor_name>")
 def device_page(sensor_name: str):
     """Device history page for a specific sensor."""
     # Validate sensor exists
-    sensor_config = next((s for s in SENSORS if s["field"] == sensor_name), None)
+    sensor_config = next((s for s in SENSORS if s.field == sensor_name), None)
     if not sensor_config:
         return jsonify({"status": "error", "message": "Unknown sensor"}), 404
 
     # Render template with sensor info
     html = DEVICE_HTML.replace("{{ sensor_name }}", sensor_name)
-    html = html.replace("{{ sensor_display_name }}", sensor_config["name"])
-    html = html.replace("{{ unit }}", sensor_config["unit"])
+    html = html.replace("{{ sensor_display_name }}", sensor_config.name)
+    html = html.replace("{{ unit }}", sensor_config.unit)
     return html
 
 
@@ -687,7 +1106,7 @@ def device_api(sensor_name: str):
         return auth_error
 
     # Validate sensor exists
-    sensor_config = next((s for s in SENSORS if s["field"] == sensor_name), None)
+    sensor_config = next((s for s in SENSORS if s.field == sensor_name), None)
     if not sensor_config:
         return jsonify({"status": "error", "message": "Unknown sensor"}), 404
 
@@ -737,19 +1156,26 @@ def device_api(sensor_name: str):
         return jsonify({"status": "error", "message": "Database error"}), 500
 
 
-@app.route("/health")
+@app.route("/health", methods=["GET", "HEAD"])
 def health():
     """Health check endpoint that also verifies database connectivity."""
+    # Liveness probes only need the status line, so skip the database
+    if request.method == "HEAD":
+        return "", 200
+
     try:
         with get_db() as conn:
             cursor = conn.cursor()
-            cursor.execute("SELECT COUNT(*) FROM readings")
-            count = cursor.fetchone()[0]
+            # AUTOINCREMENT keeps the last issued id in sqlite_sequence, which
+            # equals the row count for an append-only table without an O(N) scan
+            cursor.execute("SELECT seq FROM sqlite_sequence WHERE name='readings'")
+            row = cursor.fetchone()
+            count = row[0] if row else 0
 
         return jsonify(
             {
                 "status": "ok",
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": now_iso(),
                 "readings_count": count,
                 "rate_limiting": RATE_LIMITING_ENABLED,
                 "authentication": API_KEY is not None,
@@ -762,7 +1188,7 @@ def health():
                 {
                     "status": "error",
                     "message": "Database connection failed",
-                    "timestamp": datetime.now().isoformat(),
+                    "timestamp": now_iso(),
                 }
             ),
             503,
@@ -777,6 +1203,11 @@ def main() -> None:
     parser.add_argument(
         "--port", type=int, default=PORT, help=f"Port to listen on (default: {PORT})"
     )
+    parser.add_argument(
+        "--dev",
+        action="store_true",
+        help="Use Flask's development server instead of gunicorn",
+    )
     args = parser.parse_args()
 
     # Validate configuration before starting
@@ -788,7 +1219,7 @@ def main() -> None:
     logger.info("=" * 60)
     logger.info(f"Dashboard: http://localhost:{args.port}/")
     logger.info(f"Log endpoint: http://<your-ip>:{args.port}/log")
-    logger.info(f"Configured sensors: {[s['field'] for s in SENSORS]}")
+    logger.info(f"Configured sensors: {[s.field for s in SENSORS]}")
     logger.info(f"Rate limiting: {'enabled' if RATE_LIMITING_ENABLED else 'disabled'}")
     logger.info(f"Authentication: {'enabled' if API_KEY else 'disabled'}")
     logger.info("")
@@ -797,6 +1228,39 @@ def main() -> None:
     logger.info("       -F 'outside_temp=18.5' -F 'outside_humidity=65'")
     logger.info("=" * 60)
 
+    gunicorn_path = shutil.which("gunicorn")
+    if not args.dev and not args.https and gunicorn_path:
+        logger.info(f"Starting gunicorn ({WORKERS} workers x {THREADS} threads)...")
+        module = os.path.splitext(os.path.basename(__file__))[0]
+        # Release the connection opened by init_db before replacing the process
+        _close_connections()
+        os.execv(  # nosec B606 - fixed argument list, no shell
+            gunicorn_path,
+            [
+                "gunicorn",
+                "-k",
+                "gthread",
+                "-w",
+                str(WORKERS),
+                "--threads",
+                str(THREADS),
+                "-b",
+                f"{HOST}:{args.port}",
+                "--pythonpath",
+                os.path.dirname(os.path.abspath(__file__)),
+                f"{module}:app",
+            ],
+        )
+
+    if not args.dev:
+        if args.https:
+            logger.info("--https runs on Flask's development server")
+        else:
+            logger.warning(
+                "gunicorn not installed, using Flask's development server. "
+                "Install with: pip install gunicorn"
+            )
+
     if args.https:
         logger.info("Starting with HTTPS (self-signed certificate)...")
         app.run(host=HOST, port=args.port, ssl_context="adhoc", debug=False)